@@ -1,11 +1,20 @@
 from flask import Flask, render_template, request, redirect, url_for, flash, session, send_file, send_from_directory, jsonify
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.exc import SQLAlchemyError
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
 import os
+import csv
+import io
+import math
+import shutil
+import zipfile
 import datetime
 import uuid
+import time
+import click
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 
 app = Flask(__name__)
@@ -54,6 +63,7 @@ class Project(db.Model):
     orders = db.relationship('Order', backref='project', lazy=True)
 
 class Order(db.Model):
+    __table_args__ = {'sqlite_autoincrement': True}
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     project_id = db.Column(db.Integer, db.ForeignKey('project.id'), nullable=False)
@@ -63,6 +73,7 @@ class Order(db.Model):
     transaction_id = db.Column(db.String(100))
 
 class Contact(db.Model):
+    __table_args__ = {'sqlite_autoincrement': True}
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     email = db.Column(db.String(120), nullable=False)
@@ -71,6 +82,7 @@ class Contact(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
 
 class Inquiry(db.Model):
+    __table_args__ = {'sqlite_autoincrement': True}
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     email = db.Column(db.String(120), nullable=False)
@@ -83,6 +95,74 @@ class Inquiry(db.Model):
     # Relationship
     project = db.relationship('Project', backref='inquiries')
 
+# Archive Models (stored in the 'archive' bind, see SQLALCHEMY_BINDS)
+class ArchivedOrder(db.Model):
+    __bind_key__ = 'archive'
+    id = db.Column(db.Integer, primary_key=True)
+    source_id = db.Column(db.Integer, nullable=False, index=True)  # id in the live table
+    user_id = db.Column(db.Integer, nullable=False, index=True)
+    project_id = db.Column(db.Integer, nullable=False)
+    payment_status = db.Column(db.String(50))
+    amount = db.Column(db.Float, nullable=False)
+    timestamp = db.Column(db.DateTime, index=True)
+    transaction_id = db.Column(db.String(100))
+    archived_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+
+    is_archived = True
+
+    @property
+    def user(self):
+        if '_user' not in self.__dict__:
+            self._user = db.session.get(User, self.user_id)
+        return self._user
+
+    @property
+    def project(self):
+        if '_project' not in self.__dict__:
+            self._project = db.session.get(Project, self.project_id)
+        return self._project
+
+class ArchivedContact(db.Model):
+    __bind_key__ = 'archive'
+    id = db.Column(db.Integer, primary_key=True)
+    source_id = db.Column(db.Integer, nullable=False, index=True)  # id in the live table
+    name = db.Column(db.String(100), nullable=False)
+    email = db.Column(db.String(120), nullable=False)
+    subject = db.Column(db.String(200), nullable=False)
+    message = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, index=True)
+    archived_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+
+    is_archived = True
+
+class ArchivedInquiry(db.Model):
+    __bind_key__ = 'archive'
+    id = db.Column(db.Integer, primary_key=True)
+    source_id = db.Column(db.Integer, nullable=False, index=True)  # id in the live table
+    name = db.Column(db.String(100), nullable=False)
+    email = db.Column(db.String(120), nullable=False)
+    phone = db.Column(db.String(20))
+    project_id = db.Column(db.Integer, nullable=False)
+    message = db.Column(db.Text)
+    status = db.Column(db.String(50))
+    created_at = db.Column(db.DateTime, index=True)
+    archived_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+
+    is_archived = True
+
+    @property
+    def project(self):
+        if '_project' not in self.__dict__:
+            self._project = db.session.get(Project, self.project_id)
+        return self._project
+
+# (hot model, archive model, date column) for each table covered by archiving
+ARCHIVE_TABLES = [
+    (Contact, ArchivedContact, 'created_at'),
+    (Inquiry, ArchivedInquiry, 'created_at'),
+    (Order, ArchivedOrder, 'timestamp'),
+]
+
 @login_manager.user_loader
 def load_user(user_id):
     return User.query.get(int(user_id))
@@ -96,6 +176,308 @@ def admin_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+# Bulk project import
+IMPORT_REQUIRED_FIELDS = ['title', 'description', 'price', 'category', 'tech_stack', 'branch', 'file']
+PROJECT_FILE_EXTENSIONS = {'.zip', '.pdf'}
+PREVIEW_IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.webp'}
+
+def open_import_bundle(source):
+    """Open a bundle of project files (ZIP archive or directory) and list its members"""
+    if isinstance(source, str) and os.path.isdir(source):
+        names = set()
+        for root, _, files in os.walk(source):
+            for name in files:
+                names.add(os.path.relpath(os.path.join(root, name), source).replace(os.sep, '/'))
+        return source, names
+
+    bundle = zipfile.ZipFile(source)
+    names = {name for name in bundle.namelist() if not name.endswith('/')}
+    return bundle, names
+
+def copy_bundle_member(bundle, member, filename):
+    """Stream a single bundle member into the upload folder"""
+    destination = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    if isinstance(bundle, zipfile.ZipFile):
+        with bundle.open(member) as src, open(destination, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+    else:
+        shutil.copyfile(os.path.join(bundle, member), destination)
+
+def validate_import_rows(manifest, bundle_names):
+    """Validate manifest rows, returning (rows, errors) where errors are (line, message)"""
+    reader = csv.DictReader(manifest)
+    missing = [field for field in IMPORT_REQUIRED_FIELDS if field not in (reader.fieldnames or [])]
+    if missing:
+        return [], [(1, f"Manifest is missing columns: {', '.join(missing)}")]
+
+    rows = []
+    errors = []
+    uploaded_date = datetime.datetime.utcnow()
+    for record in reader:
+        line = reader.line_num
+        record = {key: (value or '').strip() for key, value in record.items() if key}
+
+        empty = [field for field in IMPORT_REQUIRED_FIELDS if not record.get(field)]
+        if empty:
+            errors.append((line, f"Missing values for: {', '.join(empty)}"))
+            continue
+
+        try:
+            price = float(record['price'])
+        except ValueError:
+            price = None
+        if price is None or not math.isfinite(price):
+            errors.append((line, f"Invalid price: {record['price']}"))
+            continue
+        if price < 0:
+            errors.append((line, 'Price cannot be negative'))
+            continue
+
+        member = record['file']
+        if member not in bundle_names:
+            errors.append((line, f"File not found in bundle: {member}"))
+            continue
+        if os.path.splitext(member)[1].lower() not in PROJECT_FILE_EXTENSIONS:
+            errors.append((line, f"Project file must be ZIP or PDF: {member}"))
+            continue
+
+        preview_member = record.get('preview_image') or None
+        if preview_member:
+            if preview_member not in bundle_names:
+                errors.append((line, f"Preview image not found in bundle: {preview_member}"))
+                continue
+            if os.path.splitext(preview_member)[1].lower() not in PREVIEW_IMAGE_EXTENSIONS:
+                errors.append((line, f"Unsupported preview image type: {preview_member}"))
+                continue
+
+        filename = secure_filename(f"{uuid.uuid4()}_{os.path.basename(member)}")
+        preview_filename = None
+        if preview_member:
+            preview_filename = secure_filename(f"preview_{uuid.uuid4()}_{os.path.basename(preview_member)}")
+
+        rows.append({
+            'line': line,
+            'file': (member, filename),
+            'preview_image': (preview_member, preview_filename) if preview_member else None,
+            'project': {
+                'title': record['title'],
+                'description': record['description'],
+                'price': price,
+                'file_path': filename,
+                'category': record['category'],
+                'tech_stack': record['tech_stack'],
+                'branch': record['branch'],
+                'preview_image': preview_filename,
+                'uploaded_date': uploaded_date,
+            },
+        })
+
+    return rows, errors
+
+def remove_uploaded_files(filenames):
+    """Best-effort cleanup of files written to the upload folder"""
+    for filename in filenames:
+        path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+        if os.path.exists(path):
+            os.remove(path)
+
+def import_projects(manifest, bundle_source, dry_run=False, batch_size=None, workers=None):
+    """Import projects from a CSV manifest and a bundle of project files.
+
+    Files are copied into the upload folder in parallel and projects are
+    inserted with one bulk insert per batch. Returns a report dict with the
+    number of rows seen and imported plus a list of (line, message) errors.
+    """
+    batch_size = batch_size or app.config['IMPORT_BATCH_SIZE']
+    workers = workers or app.config['IMPORT_WORKERS']
+
+    bundle, bundle_names = open_import_bundle(bundle_source)
+    try:
+        rows, errors = validate_import_rows(manifest, bundle_names)
+        report = {
+            'total': len(rows) + len(errors),
+            'valid': len(rows),
+            'imported': 0,
+            'errors': errors,
+            'dry_run': dry_run,
+        }
+        if dry_run or not rows:
+            return report
+
+        def copy_row_files(row):
+            written = []
+            try:
+                for entry in (row['file'], row['preview_image']):
+                    if entry:
+                        copy_bundle_member(bundle, entry[0], entry[1])
+                        written.append(entry[1])
+            except (OSError, KeyError, RuntimeError, NotImplementedError, zipfile.BadZipFile) as e:
+                remove_uploaded_files(written)
+                return written, f"Could not copy files: {e}"
+            return written, None
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for start in range(0, len(rows), batch_size):
+                chunk = rows[start:start + batch_size]
+                batch = []
+                for row, (written, error) in zip(chunk, executor.map(copy_row_files, chunk)):
+                    if error:
+                        errors.append((row['line'], error))
+                        continue
+                    batch.append((row, written))
+
+                if not batch:
+                    continue
+
+                try:
+                    db.session.bulk_insert_mappings(Project, [row['project'] for row, _ in batch])
+                    db.session.commit()
+                    report['imported'] += len(batch)
+                    continue
+                except SQLAlchemyError:
+                    db.session.rollback()
+
+                # Retry row by row so one bad row does not fail the whole batch
+                for row, written in batch:
+                    try:
+                        db.session.bulk_insert_mappings(Project, [row['project']])
+                        db.session.commit()
+                        report['imported'] += 1
+                    except SQLAlchemyError as e:
+                        db.session.rollback()
+                        remove_uploaded_files(written)
+                        errors.append((row['line'], f"Database insert failed ({type(getattr(e, 'orig', None) or e).__name__})"))
+
+        errors.sort(key=lambda error: error[0])
+        return report
+    finally:
+        if isinstance(bundle, zipfile.ZipFile):
+            bundle.close()
+
+# Data archiving
+def archive_criteria(model, date_column, cutoff):
+    """Filter selecting hot rows that are due for archiving"""
+    criteria = getattr(model, date_column) < cutoff
+    if model is Inquiry:
+        criteria = db.or_(criteria, Inquiry.status == 'closed')
+    return criteria
+
+def archive_batch(model, archive_model, date_column, criteria, batch_size):
+    """Move one batch of rows into the archive, returning the number moved.
+
+    Rows are copied and committed before they are deleted from the hot table,
+    so an interrupted run leaves duplicates rather than losing data. A row is
+    only skipped as already archived when both its id and date match, since
+    older databases may have reused the id of an archived row.
+    """
+    rows = model.query.filter(criteria).order_by(model.id).limit(batch_size).all()
+    if not rows:
+        return 0
+
+    ids = [row.id for row in rows]
+    archive_date = getattr(archive_model, date_column)
+    already_archived = set(
+        db.session.query(archive_model.source_id, archive_date).filter(archive_model.source_id.in_(ids))
+    )
+    columns = [column.key for column in model.__table__.columns if column.key != 'id']
+    archived_at = datetime.datetime.utcnow()
+    mappings = [
+        dict({column: getattr(row, column) for column in columns}, source_id=row.id, archived_at=archived_at)
+        for row in rows if (row.id, getattr(row, date_column)) not in already_archived
+    ]
+    if mappings:
+        db.session.bulk_insert_mappings(archive_model, mappings)
+        db.session.commit()
+
+    model.query.filter(model.id.in_(ids)).delete(synchronize_session=False)
+    db.session.commit()
+    return len(ids)
+
+def archive_records(older_than_days=None, batch_size=None, max_batches=None, pause=0, dry_run=False):
+    """Move old contacts, inquiries and orders (and closed inquiries) into the archive.
+
+    Work is done in bounded batches, each in its own short transaction, so the
+    live tables are never locked for long. max_batches applies to each table
+    separately so a large backlog in one table does not starve the others. Returns a dict of table name to the
+    number of rows archived (or due for archiving when dry_run is set).
+    """
+    older_than_days = older_than_days if older_than_days is not None else app.config['ARCHIVE_AFTER_DAYS']
+    batch_size = batch_size or app.config['ARCHIVE_BATCH_SIZE']
+    cutoff = datetime.datetime.utcnow() - datetime.timedelta(days=older_than_days)
+
+    results = {}
+    for model, archive_model, date_column in ARCHIVE_TABLES:
+        criteria = archive_criteria(model, date_column, cutoff)
+        if dry_run:
+            results[model.__tablename__] = model.query.filter(criteria).count()
+            continue
+
+        results[model.__tablename__] = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            moved = archive_batch(model, archive_model, date_column, criteria, batch_size)
+            if not moved:
+                break
+            results[model.__tablename__] += moved
+            batches += 1
+            if pause:
+                time.sleep(pause)
+
+    return results
+
+def parse_date_arg(name):
+    """Read a YYYY-MM-DD query argument, returning a datetime or None"""
+    value = request.args.get(name, '').strip()
+    if not value:
+        return None
+    try:
+        return datetime.datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        flash(f'Invalid date: {value}', 'error')
+        return None
+
+def preload_archive_relations(records):
+    """Load the projects and users referenced by archived rows with one query each.
+
+    Archived rows live in a separate database, so they cannot use relationship
+    joins; the loaded objects are cached on each row for its properties.
+    """
+    for column, model, attribute in (('project_id', Project, '_project'), ('user_id', User, '_user')):
+        ids = {getattr(record, column) for record in records if hasattr(record, column)}
+        if not ids:
+            continue
+        loaded = {obj.id: obj for obj in model.query.filter(model.id.in_(ids))}
+        for record in records:
+            if hasattr(record, column):
+                setattr(record, attribute, loaded.get(getattr(record, column)))
+
+def query_with_archive(model, archive_model, date_column, start=None, end=None):
+    """Return records in a date range, newest first, reading the archive only when needed.
+
+    Without a date range only the hot table is queried. With one, the archive
+    is included when the range reaches back to its newest archived record.
+    """
+    def date_range_query(query_model):
+        column = getattr(query_model, date_column)
+        query = query_model.query
+        if start:
+            query = query.filter(column >= start)
+        if end:
+            query = query.filter(column < end + datetime.timedelta(days=1))
+        return query.order_by(column.desc())
+
+    records = date_range_query(model).all()
+    if start is None and end is None:
+        return records
+
+    newest_archived = db.session.query(db.func.max(getattr(archive_model, date_column))).scalar()
+    if newest_archived is None or (start is not None and newest_archived < start):
+        return records
+
+    archived = date_range_query(archive_model).all()
+    preload_archive_relations(archived)
+    return sorted(records + archived, key=lambda record: getattr(record, date_column), reverse=True)
+
 # Routes
 @app.route('/')
 def home():
@@ -194,14 +576,15 @@ def contact():
 @admin_required
 def admin_dashboard():
     total_projects = Project.query.count()
-    total_inquiries = Inquiry.query.count()
-    total_contacts = Contact.query.count()
+    # Live tables only: old records and closed inquiries are moved to the archive
+    active_inquiries = Inquiry.query.count()
+    recent_contacts = Contact.query.count()
     recent_inquiries = Inquiry.query.order_by(Inquiry.created_at.desc()).limit(5).all()
     
     return render_template('admin/dashboard.html', 
                          total_projects=total_projects,
-                         total_inquiries=total_inquiries,
-                         total_contacts=total_contacts,
+                         active_inquiries=active_inquiries,
+                         recent_contacts=recent_contacts,
                          recent_inquiries=recent_inquiries)
 
 @app.route('/admin/projects')
@@ -265,6 +648,34 @@ def admin_add_project():
     
     return render_template('admin/add_project.html')
 
+@app.route('/admin/projects/import', methods=['GET', 'POST'])
+@admin_required
+def admin_import_projects():
+    if request.method == 'POST':
+        manifest_file = request.files.get('manifest')
+        bundle_file = request.files.get('bundle')
+        if not manifest_file or manifest_file.filename == '' or not bundle_file or bundle_file.filename == '':
+            flash('Please select both a CSV manifest and a ZIP bundle', 'error')
+            return render_template('admin/import_projects.html')
+
+        dry_run = request.form.get('dry_run') == 'on'
+        manifest = io.TextIOWrapper(manifest_file.stream, encoding='utf-8-sig', newline='')
+        try:
+            report = import_projects(manifest, bundle_file.stream, dry_run=dry_run)
+        except (zipfile.BadZipFile, UnicodeDecodeError, csv.Error) as e:
+            flash(f'Could not read import files: {e}', 'error')
+            return render_template('admin/import_projects.html')
+
+        if dry_run:
+            flash(f"Dry run complete: {report['valid']} of {report['total']} rows are valid.", 'info')
+        elif report['imported']:
+            flash(f"Imported {report['imported']} of {report['total']} projects.", 'success')
+        else:
+            flash('No projects were imported.', 'error')
+        return render_template('admin/import_projects.html', report=report)
+
+    return render_template('admin/import_projects.html')
+
 @app.route('/admin/projects/edit/<int:project_id>', methods=['GET', 'POST'])
 @admin_required
 def admin_edit_project(project_id):
@@ -351,14 +762,16 @@ def admin_orders():
 @app.route('/admin/contacts')
 @admin_required
 def admin_contacts():
-    contacts = Contact.query.order_by(Contact.created_at.desc()).all()
-    return render_template('admin/contacts.html', contacts=contacts)
+    start, end = parse_date_arg('start'), parse_date_arg('end')
+    contacts = query_with_archive(Contact, ArchivedContact, 'created_at', start, end)
+    return render_template('admin/contacts.html', contacts=contacts, start=start, end=end)
 
 @app.route('/admin/inquiries')
 @admin_required
 def admin_inquiries():
-    inquiries = Inquiry.query.order_by(Inquiry.created_at.desc()).all()
-    return render_template('admin/inquiries.html', inquiries=inquiries)
+    start, end = parse_date_arg('start'), parse_date_arg('end')
+    inquiries = query_with_archive(Inquiry, ArchivedInquiry, 'created_at', start, end)
+    return render_template('admin/inquiries.html', inquiries=inquiries, start=start, end=end)
 @app.route('/login', methods=['GET', 'POST'])
 def login():
     print("Login route accessed")  # Add this line
@@ -440,8 +853,17 @@ def buy_project(project_id):
 @app.route('/download/<int:order_id>')
 @login_required
 def download_project(order_id):
-    order = Order.query.filter_by(id=order_id, user_id=current_user.id, payment_status='completed').first_or_404()
+    order = Order.query.filter_by(id=order_id, user_id=current_user.id, payment_status='completed').first()
+    if order is None:
+        # Older purchases may have been moved to the archive
+        order = ArchivedOrder.query.filter_by(source_id=order_id, user_id=current_user.id, payment_status='completed') \
+            .order_by(ArchivedOrder.timestamp.desc()).first_or_404()
     
+    if order.project is None:
+        # Projects can be deleted once their orders have been archived
+        flash('This project is no longer available.', 'error')
+        return redirect(url_for('home'))
+
     file_path = os.path.join(app.config['UPLOAD_FOLDER'], order.project.file_path)
     if not os.path.exists(file_path):
         flash('File not found.', 'error')
@@ -460,6 +882,46 @@ def uploaded_file(filename):
     """Serve uploaded files"""
     return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
 
+@app.cli.command('import-projects')
+@click.argument('manifest', type=click.Path(exists=True, dir_okay=False))
+@click.argument('bundle', type=click.Path(exists=True))
+@click.option('--dry-run', is_flag=True, help='Validate the manifest without copying files or inserting rows.')
+@click.option('--batch-size', type=click.IntRange(min=1), default=None, help='Projects per bulk insert.')
+@click.option('--workers', type=click.IntRange(min=1), default=None, help='Parallel file copies.')
+def import_projects_command(manifest, bundle, dry_run, batch_size, workers):
+    """Bulk import projects from a CSV manifest and a ZIP archive or directory of files"""
+    db.create_all()
+    try:
+        with open(manifest, encoding='utf-8-sig', newline='') as f:
+            report = import_projects(f, bundle, dry_run=dry_run, batch_size=batch_size, workers=workers)
+    except (zipfile.BadZipFile, UnicodeDecodeError, csv.Error) as e:
+        raise click.ClickException(f"Could not read import files: {e}")
+
+    for line, message in report['errors']:
+        click.echo(f"Line {line}: {message}", err=True)
+
+    if dry_run:
+        click.echo(f"Dry run: {report['valid']} of {report['total']} rows are valid")
+    else:
+        click.echo(f"Imported {report['imported']} of {report['total']} projects")
+
+@app.cli.command('archive-records')
+@click.option('--older-than-days', type=click.IntRange(min=0), default=None, help='Archive records older than this many days.')
+@click.option('--batch-size', type=click.IntRange(min=1), default=None, help='Rows moved per transaction.')
+@click.option('--max-batches', type=click.IntRange(min=1), default=None, help='Stop after this many batches per table (for incremental runs).')
+@click.option('--pause', type=click.FloatRange(min=0), default=0, help='Seconds to sleep between batches.')
+@click.option('--dry-run', is_flag=True, help='Only report how many rows are due for archiving.')
+def archive_records_command(older_than_days, batch_size, max_batches, pause, dry_run):
+    """Move old contacts, inquiries and orders into the archive database"""
+    db.create_all()
+    results = archive_records(older_than_days=older_than_days, batch_size=batch_size,
+                              max_batches=max_batches, pause=pause, dry_run=dry_run)
+    for table, count in results.items():
+        if dry_run:
+            click.echo(f"{table}: {count} rows due for archiving")
+        else:
+            click.echo(f"{table}: archived {count} rows")
+
 if __name__ == '__main__':
     with app.app_context():
         db.create_all()
@@ -6,6 +6,13 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     UPLOAD_FOLDER = 'uploads'
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
+    IMPORT_BATCH_SIZE = 500  # Project rows per bulk insert
+    IMPORT_WORKERS = 8  # Parallel file copies during bulk import
+    # Point ARCHIVE_DATABASE_URL at DATABASE_URL to keep archive tables in the main database
+    ARCHIVE_DATABASE_URI = os.environ.get('ARCHIVE_DATABASE_URL') or 'sqlite:///college_projects_archive.db'
+    SQLALCHEMY_BINDS = {'archive': ARCHIVE_DATABASE_URI}
+    ARCHIVE_AFTER_DAYS = int(os.environ.get('ARCHIVE_AFTER_DAYS') or 365)  # Age before records are archived
+    ARCHIVE_BATCH_SIZE = 500  # Rows moved per archive transaction
 
 class DevelopmentConfig(Config):
     DEBUG = True
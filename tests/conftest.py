@@ -0,0 +1,9 @@
+import os
+import sys
+import tempfile
+
+# Point the app at throwaway databases before it is imported
+_db_dir = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(_db_dir, 'live.db')
+os.environ['ARCHIVE_DATABASE_URL'] = 'sqlite:///' + os.path.join(_db_dir, 'archive.db')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,120 @@
+import datetime
+
+import pytest
+from sqlalchemy import event
+from werkzeug.security import generate_password_hash
+
+from app import app, db, archive_records, Project, User, Contact, Inquiry, Order, ArchivedInquiry, ArchivedOrder
+
+
+@pytest.fixture
+def project():
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        project = Project(title='P', description='d', price=1, file_path='p.zip',
+                          category='c', tech_stack='t', branch='b')
+        db.session.add(project)
+        db.session.commit()
+        yield project
+        db.session.remove()
+
+
+def add_inquiry(project, name, **kwargs):
+    inquiry = Inquiry(name=name, email='e@example.com', project_id=project.id, **kwargs)
+    db.session.add(inquiry)
+    db.session.commit()
+    return inquiry
+
+
+def test_new_inquiry_after_archiving_newest_is_not_lost(project):
+    for name in ('a', 'b', 'c'):
+        add_inquiry(project, name)
+    newest = Inquiry.query.order_by(Inquiry.id.desc()).first()
+    newest.status = 'closed'
+    db.session.commit()
+
+    archive_records(older_than_days=3650)
+
+    add_inquiry(project, 'd', status='closed')
+    archive_records(older_than_days=3650)
+
+    archived = {row.name for row in ArchivedInquiry.query.all()}
+    assert archived == {'c', 'd'}
+    assert Inquiry.query.count() == 2
+
+
+def test_reused_id_is_archived_not_dropped(project):
+    # Databases created before sqlite_autoincrement can still hand out a reused id
+    first = add_inquiry(project, 'old', status='closed')
+    reused_id = first.id
+    archive_records(older_than_days=3650)
+
+    add_inquiry(project, 'new', id=reused_id, status='closed')
+    archive_records(older_than_days=3650)
+
+    archived = ArchivedInquiry.query.filter_by(source_id=reused_id).all()
+    assert sorted(row.name for row in archived) == ['new', 'old']
+    assert Inquiry.query.count() == 0
+
+
+def test_archived_inquiries_view_loads_projects_in_bulk(project):
+    for name in ('a', 'b', 'c'):
+        add_inquiry(project, name, status='closed')
+    orphan = add_inquiry(project, 'orphan', status='closed')
+    orphan.project_id = project.id + 1
+    db.session.commit()
+    archive_records(older_than_days=3650)
+    db.session.add(User(name='Admin', email='admin@example.com',
+                        password_hash=generate_password_hash('pw'), is_admin=True))
+    db.session.commit()
+
+    client = app.test_client()
+    client.post('/login', data={'email': 'admin@example.com', 'password': 'pw'})
+
+    statements = []
+    def count(*args):
+        statements.append(args[2])
+    event.listen(db.engine, 'before_cursor_execute', count)
+    try:
+        response = client.get('/admin/inquiries?start=2000-01-01')
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', count)
+
+    assert response.status_code == 200
+    assert b'Deleted project' in response.data
+    assert sum('FROM project' in statement for statement in statements) == 1
+
+
+def test_max_batches_applies_to_each_table(project):
+    for i in range(5):
+        db.session.add(Contact(name='n', email='e', subject='s', message='m'))
+    db.session.commit()
+    add_inquiry(project, 'closed', status='closed')
+
+    results = archive_records(older_than_days=0, batch_size=1, max_batches=2)
+
+    assert results == {'contact': 2, 'inquiry': 1, 'order': 0}
+    assert ArchivedInquiry.query.count() == 1
+
+
+def test_download_of_archived_order_for_deleted_project(project):
+    user = User(name='Buyer', email='buyer@example.com', password_hash=generate_password_hash('pw'))
+    db.session.add(user)
+    db.session.commit()
+    order = Order(user_id=user.id, project_id=project.id, amount=1, payment_status='completed',
+                  timestamp=datetime.datetime.utcnow() - datetime.timedelta(days=400))
+    db.session.add(order)
+    db.session.commit()
+    order_id = order.id
+
+    archive_records(older_than_days=365)
+    assert ArchivedOrder.query.filter_by(source_id=order_id).count() == 1
+    db.session.delete(project)
+    db.session.commit()
+
+    client = app.test_client()
+    client.post('/login', data={'email': 'buyer@example.com', 'password': 'pw'})
+    response = client.get(f'/download/{order_id}')
+
+    assert response.status_code == 302
@@ -0,0 +1,145 @@
+import csv
+import io
+import os
+import zipfile
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app import app, db, import_projects, Project
+
+HEADER = ['title', 'description', 'price', 'category', 'tech_stack', 'branch', 'file', 'preview_image']
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    uploads = tmp_path / 'uploads'
+    uploads.mkdir()
+    monkeypatch.setitem(app.config, 'UPLOAD_FOLDER', str(uploads))
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        yield uploads
+        db.session.remove()
+
+
+def make_bundle(path, names):
+    with zipfile.ZipFile(path, 'w') as bundle:
+        for name in names:
+            bundle.writestr(name, b'data for ' + name.encode())
+    return str(path)
+
+
+def make_manifest(rows, header=HEADER):
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(header)
+    writer.writerows(rows)
+    out.seek(0)
+    return out
+
+
+def row(title, price='10', file='p.zip', preview='', description='d'):
+    return [title, description, price, 'Web Development', 'Python', 'Computer Science', file, preview]
+
+
+def test_missing_columns_are_reported(upload_dir, tmp_path):
+    bundle = make_bundle(tmp_path / 'b.zip', ['p.zip'])
+    manifest = make_manifest([['A', '10', 'p.zip']], header=['title', 'price', 'file'])
+
+    report = import_projects(manifest, bundle)
+
+    assert report['imported'] == 0
+    assert report['errors'][0][0] == 1
+    assert 'description' in report['errors'][0][1]
+
+
+@pytest.mark.parametrize('price', ['abc', '-1', 'nan', 'inf', '-inf'])
+def test_invalid_prices_are_rejected(upload_dir, tmp_path, price):
+    bundle = make_bundle(tmp_path / 'b.zip', ['p.zip'])
+    manifest = make_manifest([row('good'), row('bad', price=price)])
+
+    report = import_projects(manifest, bundle, dry_run=True)
+
+    assert report['valid'] == 1
+    assert [line for line, _ in report['errors']] == [3]
+
+
+def test_bundle_members_are_checked(upload_dir, tmp_path):
+    bundle = make_bundle(tmp_path / 'b.zip', ['p.zip', 'notes.txt', 'img.png'])
+    manifest = make_manifest([
+        row('missing file', file='other.zip'),
+        row('wrong type', file='notes.txt'),
+        row('missing preview', preview='nope.png'),
+        row('wrong preview', preview='notes.txt'),
+        row('ok', preview='img.png'),
+    ])
+
+    report = import_projects(manifest, bundle, dry_run=True)
+
+    assert report['valid'] == 1
+    messages = dict(report['errors'])
+    assert 'not found in bundle' in messages[2]
+    assert 'ZIP or PDF' in messages[3]
+    assert 'not found in bundle' in messages[4]
+    assert 'Unsupported preview' in messages[5]
+
+
+def test_error_lines_follow_multiline_fields(upload_dir, tmp_path):
+    bundle = make_bundle(tmp_path / 'b.zip', ['p.zip'])
+    manifest = make_manifest([row('A', description='line one\nline two\nline three'), row('B', price='x')])
+
+    report = import_projects(manifest, bundle, dry_run=True)
+
+    assert report['errors'] == [(5, 'Invalid price: x')]
+
+
+def test_dry_run_writes_nothing(upload_dir, tmp_path):
+    bundle = make_bundle(tmp_path / 'b.zip', ['p.zip', 'img.png'])
+    manifest = make_manifest([row('A', preview='img.png'), row('B')])
+
+    report = import_projects(manifest, bundle, dry_run=True)
+
+    assert report['valid'] == 2
+    assert report['imported'] == 0
+    assert Project.query.count() == 0
+    assert os.listdir(upload_dir) == []
+
+
+def test_import_in_multiple_batches(upload_dir, tmp_path):
+    names = [f'projects/{i}.zip' for i in range(7)] + ['img.png']
+    bundle = make_bundle(tmp_path / 'b.zip', names)
+    manifest = make_manifest([row(f'P{i}', price=str(i), file=f'projects/{i}.zip',
+                                  preview='img.png' if i % 2 else '') for i in range(7)])
+
+    report = import_projects(manifest, bundle, batch_size=3, workers=2)
+
+    assert report['imported'] == 7
+    assert report['errors'] == []
+    projects = Project.query.order_by(Project.price).all()
+    assert [project.title for project in projects] == [f'P{i}' for i in range(7)]
+    for i, project in enumerate(projects):
+        with open(upload_dir / project.file_path, 'rb') as f:
+            assert f.read() == f'data for projects/{i}.zip'.encode()
+        assert (project.preview_image is not None) == bool(i % 2)
+    assert len(os.listdir(upload_dir)) == 7 + 3
+
+
+def test_failed_row_does_not_fail_its_batch(upload_dir, tmp_path, monkeypatch):
+    bundle = make_bundle(tmp_path / 'b.zip', ['p.zip'])
+    manifest = make_manifest([row('A'), row('boom'), row('C')])
+
+    original = Session.bulk_insert_mappings
+    def bulk_insert_mappings(self, mapper, mappings, *args, **kwargs):
+        if any(mapping['title'] == 'boom' for mapping in mappings):
+            raise IntegrityError('INSERT INTO project ...', {}, Exception('constraint failed'))
+        return original(self, mapper, mappings, *args, **kwargs)
+    monkeypatch.setattr(Session, 'bulk_insert_mappings', bulk_insert_mappings)
+
+    report = import_projects(manifest, bundle, batch_size=10)
+
+    assert report['imported'] == 2
+    assert report['errors'] == [(3, 'Database insert failed (Exception)')]
+    assert sorted(project.title for project in Project.query.all()) == ['A', 'C']
+    assert len(os.listdir(upload_dir)) == 2